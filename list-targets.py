@@ -5,30 +5,31 @@ import pprint
 import re
 
 def printboards(boards):
-    print("%s\n" % re.sub(r"'|[)]|[(]|^ ", '', pprint.pformat("%s" % boards, width=80)))
+    print("%s\n" % re.sub(r"'|[)]|[(]|^ ", '', pprint.pformat(" ".join(boards), width=80)))
 
 os.chdir("boards.d")
 
-allwinner = ""
-am625 = ""
-qcom = ""
-rk3xxx = ""
-other = ""
-
-for entry in sorted(os.listdir('.')):
-
-    if os.path.islink(entry):
-        if 'AllWinner' == os.path.basename(os.path.realpath(entry)):
-            allwinner += "%s " % entry
-        elif 'am625' == os.path.basename(os.path.realpath(entry)):
-            am625 += "%s " % entry
-        elif 'qcom' == os.path.basename(os.path.realpath(entry)):
-            qcom += "%s " % entry
-        elif 'rk3xxx' == os.path.basename(os.path.realpath(entry)):
-            rk3xxx += "%s " % entry
-        else:
-            if entry != 'none':
-                other += "%s " % entry
+allwinner = []
+am625 = []
+qcom = []
+rk3xxx = []
+other = []
+
+socs = {
+    'AllWinner': allwinner,
+    'am625': am625,
+    'qcom': qcom,
+    'rk3xxx': rk3xxx,
+}
+
+with os.scandir('.') as it:
+    entries = sorted(it, key=lambda e: e.name)
+
+for entry in entries:
+
+    if entry.is_symlink() and entry.name != 'none':
+        # boards.d entries link straight to their socs.d file
+        socs.get(os.path.basename(os.readlink(entry.name)), other).append(entry.name)
 
 
 print("AllWinner Devices:")